@@ -1,10 +1,12 @@
-import json
+import hashlib
+from typing import Optional
+import orjson
 import streamlit as st
 import pandas as pd
 
-from inspector.io import load_dataset
+from inspector.io import ArrowSpillStore, dataframe_to_csv_bytes, load_dataset
 from inspector.cleaning import safe_clean_dataframe
-from inspector.profiling import build_column_profile
+from inspector.profiling import build_column_profile, count_duplicate_rows, count_missing_cells
 from inspector.rules import detect_issues
 
 
@@ -31,10 +33,71 @@ st.title("📦 Data Drop Inspector")
 st.caption("Upload a dataset and run an inspection to generate a fast data health report.")
 
 
+# -----------------------------
+# Cached computations
+# -----------------------------
+# Streamlit reruns the whole script on every widget interaction. The heavy
+# steps are cached on a stable dataset id (hash of the uploaded bytes), so
+# reruns become cache lookups. Underscore-prefixed args are not hashed.
+def _file_id(uploaded_file) -> str:
+    h = hashlib.md5(uploaded_file.getvalue())
+    h.update(uploaded_file.name.encode("utf-8"))
+    return h.hexdigest()
+
+
+@st.cache_resource(show_spinner=False)
+def _spill_store() -> ArrowSpillStore:
+    # One per process: parsed datasets are kept on disk as Arrow IPC and memory-mapped back
+    return ArrowSpillStore(max_entries=4)
+
+
+def _current_df() -> Optional[pd.DataFrame]:
+    if st.session_state.df is not None:
+        return st.session_state.df
+    if st.session_state.df_id is None:
+        return None
+    return _spill_store().get(st.session_state.df_id)
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _cached_profile(df_id: str, _df: pd.DataFrame) -> pd.DataFrame:
+    return build_column_profile(_df)
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _cleaned_csv(cleaned_id: str, _cleaned_df: pd.DataFrame) -> bytes:
+    return dataframe_to_csv_bytes(_cleaned_df)
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _dup_count(df_id: str, _df: pd.DataFrame) -> int:
+    return count_duplicate_rows(_df)
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _cached_issues(df_id: str, _df: pd.DataFrame, _profile_rows: list[dict]) -> list[dict]:
+    return detect_issues(_df, _profile_rows, dup_count=_dup_count(df_id, _df))
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _cached_clean(df_id: str, _df: pd.DataFrame, drop_exact_duplicates: bool) -> pd.DataFrame:
+    return safe_clean_dataframe(_df, drop_exact_duplicates=drop_exact_duplicates)
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _dataset_summary(df_id: str, _df: pd.DataFrame) -> dict:
+    return {
+        "rows": int(_df.shape[0]),
+        "columns": int(_df.shape[1]),
+        "missing_cells_total": count_missing_cells(_df),
+        "duplicate_rows_total": _dup_count(df_id, _df),
+    }
+
+
 # -----------------------------
 # Session state
 # -----------------------------
-for key in ["df", "profile_df", "issues", "report", "cleaned_df", "filename"]:
+for key in ["df", "df_id", "profile_df", "profile_id", "issues", "report", "cleaned_df", "cleaned_id", "filename"]:
     if key not in st.session_state:
         st.session_state[key] = None
 
@@ -57,12 +120,20 @@ with st.sidebar:
 # -----------------------------
 if uploaded_file:
     try:
-        df = load_dataset(uploaded_file)
-        if df.empty:
-            st.warning("The file loaded successfully, but the dataset is empty.")
-        else:
-            st.session_state.df = df
-            st.session_state.filename = uploaded_file.name
+        df_id = _file_id(uploaded_file)
+        # Reruns with the same file skip parsing; the frame is read back from the spill store
+        if df_id != st.session_state.df_id or _current_df() is None:
+            # A file already in the spill store (e.g. opened by another session) is not parsed again.
+            # Not st.cache_data: that would keep a pickled in-memory copy next to the mapped file.
+            df = None if _spill_store().get(df_id) is not None else load_dataset(uploaded_file)
+            if df is not None and df.empty:
+                st.warning("The file loaded successfully, but the dataset is empty.")
+            else:
+                # Mixed-type object columns cannot go to Arrow; keep those frames in memory
+                spilled = df is None or _spill_store().put(df_id, df)
+                st.session_state.df = None if spilled else df
+                st.session_state.df_id = df_id
+                st.session_state.filename = uploaded_file.name
     except Exception as e:
         st.error(f"Error loading file: {e}")
 
@@ -71,41 +142,40 @@ if uploaded_file:
 # Run inspection
 # -----------------------------
 if run:
-    if st.session_state.df is None:
+    df = _current_df()
+    if df is None:
         st.warning("Upload a file first.")
     else:
         with st.spinner("Running inspection..."):
-            df = st.session_state.df
+            df_id = st.session_state.df_id
 
-            profile_df = build_column_profile(df)
+            profile_df = _cached_profile(df_id, df)
             profile_rows = profile_df.to_dict(orient="records")
-            issues = detect_issues(df, profile_rows)
+            issues = _cached_issues(df_id, df, profile_rows)
 
             report = {
-                "dataset": {
-                    "rows": int(df.shape[0]),
-                    "columns": int(df.shape[1]),
-                    "missing_cells_total": int(df.isna().sum().sum()),
-                    "duplicate_rows_total": int(df.duplicated().sum()),
-                },
+                "dataset": _dataset_summary(df_id, df),
                 "profile": profile_rows,
                 "issues": issues,
             }
 
             st.session_state.profile_df = profile_df
+            st.session_state.profile_id = df_id
             st.session_state.issues = issues
             st.session_state.report = report
-            st.session_state.cleaned_df = safe_clean_dataframe(df, drop_exact_duplicates=drop_dups)
+            st.session_state.cleaned_df = _cached_clean(df_id, df, drop_dups)
+            st.session_state.cleaned_id = f"{df_id}-{int(drop_dups)}"
 
 
 # -----------------------------
 # Main content
 # -----------------------------
-if st.session_state.df is None:
+df = _current_df()
+if df is None:
     st.info("Upload a file from the sidebar to get started.")
     st.stop()
 
-df = st.session_state.df
+summary = _dataset_summary(st.session_state.df_id, df)
 filename = st.session_state.filename or "uploaded file"
 
 # Section header + calmer hierarchy
@@ -113,18 +183,30 @@ st.markdown("### Dataset overview")
 st.caption(f"`{filename}`")
 
 m1, m2, m3, m4 = st.columns(4)
-m1.metric("Rows", df.shape[0])
-m2.metric("Columns", df.shape[1])
-m3.metric("Missing cells", int(df.isna().sum().sum()))
-m4.metric("Exact duplicates", int(df.duplicated().sum()))
+m1.metric("Rows", summary["rows"])
+m2.metric("Columns", summary["columns"])
+m3.metric("Missing cells", summary["missing_cells_total"])
+m4.metric("Exact duplicates", summary["duplicate_rows_total"])
+
+# A radio instead of st.tabs: tab bodies all execute on every rerun, this only runs the active one
+active = st.radio(
+    "Section",
+    ["Overview", "Column Health", "Issues", "Exports"],
+    horizontal=True,
+    label_visibility="collapsed",
+    key="active_tab",
+)
 
-tabs = st.tabs(["Overview", "Column Health", "Issues", "Exports"])
+# Streamlit drops a widget's state on runs where it is not rendered; re-assigning it keeps
+# the Column Health filter while another section is open
+if "column_filter" in st.session_state:
+    st.session_state.column_filter = st.session_state.column_filter
 
 
 # -----------------------------
 # Overview tab
 # -----------------------------
-with tabs[0]:
+if active == "Overview":
     st.markdown("### Preview")
     st.dataframe(df.head(25), use_container_width=True)
 
@@ -136,26 +218,31 @@ with tabs[0]:
 # -----------------------------
 # Column Health tab
 # -----------------------------
-with tabs[1]:
+if active == "Column Health":
     if st.session_state.profile_df is None:
         st.info("Run inspection to generate the Column Health table.")
     else:
         st.markdown("### Column Health")
         st.caption("Sorted by missingness (null %) to quickly spot risky fields.")
 
-        prof = st.session_state.profile_df.copy().sort_values(by="null_%", ascending=False)
+        q = st.text_input("Filter columns (contains)", key="column_filter")
 
-        q = st.text_input("Filter columns (contains)", value="")
-        if q.strip():
-            prof = prof[prof["column"].str.lower().str.contains(q.strip().lower(), na=False)]
+        # Only re-sort/filter when the rendered profile or the query actually changed
+        view_key = (st.session_state.profile_id, q.strip().lower())
+        if st.session_state.get("prof_view_key") != view_key:
+            prof = st.session_state.profile_df.sort_values(by="null_%", ascending=False)
+            if view_key[1]:
+                prof = prof[prof["column"].str.lower().str.contains(view_key[1], na=False)]
+            st.session_state.prof_view = prof
+            st.session_state.prof_view_key = view_key
 
-        st.dataframe(prof, use_container_width=True)
+        st.dataframe(st.session_state.prof_view, use_container_width=True)
 
 
 # -----------------------------
 # Issues tab
 # -----------------------------
-with tabs[2]:
+if active == "Issues":
     if st.session_state.issues is None:
         st.info("Run inspection to see issues & recommendations.")
     else:
@@ -213,14 +300,19 @@ with tabs[2]:
 # -----------------------------
 # Exports tab
 # -----------------------------
-with tabs[3]:
+if active == "Exports":
     if st.session_state.report is None or st.session_state.cleaned_df is None:
         st.info("Run inspection to enable downloads.")
     else:
         st.markdown("### Download artifacts")
         st.caption("Export a JSON report and a safely cleaned CSV for downstream work.")
 
-        report_json = json.dumps(st.session_state.report, indent=2, default=str)
+        # Native numpy/datetime encoding; default=str only for stragglers like pd.Timestamp
+        report_json = orjson.dumps(
+            st.session_state.report,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC,
+        )
         st.download_button(
             "Download report (JSON)",
             data=report_json,
@@ -229,7 +321,7 @@ with tabs[3]:
             use_container_width=True,
         )
 
-        cleaned_csv = st.session_state.cleaned_df.to_csv(index=False).encode("utf-8")
+        cleaned_csv = _cleaned_csv(st.session_state.cleaned_id, st.session_state.cleaned_df)
         st.download_button(
             "Download cleaned CSV (safe clean)",
             data=cleaned_csv,
@@ -1,4 +1,20 @@
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from inspector.io import as_text
+
+EMPTY_TOKENS = pa.array(["", "na", "n/a", "null", "none"], type=pa.string())
+
+
+def _clean_string_column(s: pd.Series) -> pd.Series:
+    # Factorize once, trim + mask empty tokens on the distinct values only (Arrow C++ kernels),
+    # then gather back through the integer codes. Cheap on the low-cardinality columns that dominate.
+    codes, uniques = pd.factorize(as_text(s))
+    arr = pc.utf8_trim_whitespace(pa.array(uniques))
+    arr = pc.if_else(pc.is_in(arr, value_set=EMPTY_TOKENS), pa.scalar(None, type=pa.string()), arr)
+    cleaned = pd.arrays.ArrowStringArray(arr).take(codes, allow_fill=True)
+    return pd.Series(cleaned, index=s.index, name=s.name)
 
 
 def safe_clean_dataframe(df: pd.DataFrame, drop_exact_duplicates: bool = True) -> pd.DataFrame:
@@ -8,19 +24,16 @@ def safe_clean_dataframe(df: pd.DataFrame, drop_exact_duplicates: bool = True) -
     - Strip whitespace in string cells
     - Convert common empty strings to NA
     - Optionally drop exact duplicate rows
+    Columns that are not rewritten share memory with `df` (no full copy is made).
     """
-    out = df.copy()
+    out = df.copy(deep=False)
     out.columns = [str(c).strip() for c in out.columns]
 
     for col in out.columns:
         if pd.api.types.is_object_dtype(out[col]) or pd.api.types.is_string_dtype(out[col]):
-            out[col] = out[col].astype("string")
-            out[col] = out[col].str.strip()
-            out[col] = out[col].replace(
-                {"": pd.NA, "na": pd.NA, "n/a": pd.NA, "null": pd.NA, "none": pd.NA}
-            )
+            out[col] = _clean_string_column(out[col])
 
     if drop_exact_duplicates:
         out = out.drop_duplicates()
 
-    return out
\ No newline at end of file
+    return out
@@ -1,4 +1,204 @@
+import atexit
+import codecs
+import csv
+import io
+import os
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+import charset_normalizer
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+import pyarrow.feather as pa_feather
+
+CSV_BLOCK_SIZE = 8 << 20  # 8 MiB per parser block
+CSV_PROBE_BLOCK_SIZE = 1 << 20  # 1 MiB read ahead of the full parse to pick column types
+SNIFF_BYTES = 64 << 10  # 64 KiB peeked before parsing
+SNIFF_DELIMITERS = ",;\t|"
+ARROW_STRING = pd.StringDtype("pyarrow")
+_ARROW_TYPES_MAPPER = {pa.string(): ARROW_STRING, pa.large_string(): ARROW_STRING}.get
+# pd.read_csv's default NA tokens
+PANDAS_NA_VALUES = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND", "1.#QNAN",
+    "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+]
+# Number literals pd.read_csv accepts (pyarrow also takes e.g. hex "0x1F")
+_PANDAS_INT_PATTERN = r"^[+-]?\d+$"
+_PANDAS_FLOAT_PATTERN = r"(?i)^[+-]?(?:(?:\d+\.?\d*|\.\d+)(?:e[+-]?\d+)?|inf|infinity)$"
+
+
+def _sniff(buf: bytes) -> dict:
+    """
+    Detect encoding and delimiter from the head of a file.
+    Raises ValueError if the bytes do not look like text, before any full parse is attempted.
+    """
+    if not buf:
+        return {"sep": ",", "encoding": "utf8"}
+
+    try:
+        # Incremental decode tolerates a multi-byte char cut off at the end of the peek
+        text = codecs.getincrementaldecoder("utf-8")().decode(buf, final=False)
+        encoding = "utf8"
+    except UnicodeDecodeError:
+        best = charset_normalizer.from_bytes(buf).best()
+        if best is None:
+            raise ValueError("The file does not look like a text CSV.")
+        text, encoding = str(best), best.encoding
+    if "\x00" in text:
+        raise ValueError("The file does not look like a text CSV.")
+
+    try:
+        sep = csv.Sniffer().sniff(text, delimiters=SNIFF_DELIMITERS).delimiter
+    except csv.Error:
+        sep = ","
+    return {"sep": sep, "encoding": encoding}
+
+
+def _dedup_names(names: list[str]) -> list[str]:
+    # Same header mangling as pd.read_csv: blank -> "Unnamed: i", repeats -> "a.1", "a.2", ...
+    names = [name if name else f"Unnamed: {i}" for i, name in enumerate(names)]
+    seen: set[str] = set()
+    counts: dict[str, int] = {}
+    for i, name in enumerate(names):
+        if name in seen:
+            count = counts.get(name, 0) + 1
+            while f"{name}.{count}" in seen or f"{name}.{count}" in names[i + 1:]:
+                count += 1
+            counts[name] = count
+            name = f"{name}.{count}"
+        seen.add(name)
+        names[i] = name
+    return names
+
+
+def _csv_options(dialect: dict, block_size: int = CSV_BLOCK_SIZE, column_types=None,
+                 include_columns=None, **read_kwargs) -> dict:
+    return {
+        "read_options": pa_csv.ReadOptions(
+            use_threads=True, block_size=block_size, encoding=dialect["encoding"], **read_kwargs
+        ),
+        "parse_options": pa_csv.ParseOptions(delimiter=dialect["sep"], newlines_in_values=True),
+        "convert_options": pa_csv.ConvertOptions(
+            column_types=column_types,
+            include_columns=include_columns,
+            null_values=PANDAS_NA_VALUES,
+            true_values=["True", "TRUE", "true"],
+            false_values=["False", "FALSE", "false"],
+            strings_can_be_null=True,
+        ),
+    }
+
+
+def _arrow_csv_table(uploaded_file, dialect: dict, **kwargs) -> pa.Table:
+    uploaded_file.seek(0)
+    return pa_csv.read_csv(uploaded_file, **_csv_options(dialect, **kwargs))
+
+
+def _arrow_csv_probe(uploaded_file, dialect: dict, **kwargs) -> pa_csv.CSVStreamingReader:
+    # Streaming reader: opening it parses and type-infers the first CSV_PROBE_BLOCK_SIZE block only
+    uploaded_file.seek(0)
+    return pa_csv.open_csv(uploaded_file, **_csv_options(dialect, block_size=CSV_PROBE_BLOCK_SIZE, **kwargs))
+
+
+def _pandas_number_type(text: pa.Array, inferred: pa.DataType) -> Optional[pa.DataType]:
+    """
+    Type pd.read_csv gives a column pyarrow inferred as `inferred` (integer or float) from the raw
+    `text` values, or None if the two agree.
+    """
+    has_nulls = text.null_count > 0
+    text = pc.utf8_trim_whitespace(text.drop_null())
+    if not len(text):
+        return None
+    all_ints = pc.all(pc.match_substring_regex(text, _PANDAS_INT_PATTERN)).as_py()
+    if pa.types.is_integer(inferred):
+        return None if all_ints else pa.string()
+    if all_ints:
+        # Signed ("+5") or beyond-int64 literals: pyarrow reads floats, pandas int64 or text
+        if has_nulls:
+            return None
+        try:
+            pc.cast(pc.utf8_ltrim(text, characters="+"), pa.int64())
+        except pa.ArrowInvalid:
+            return pa.string()
+        return pa.int64()
+    if not pc.all(pc.match_substring_regex(text, _PANDAS_FLOAT_PATTERN)).as_py():
+        return pa.string()
+    # pandas keeps overflowing literals ("1e400") as text; pyarrow reads them as inf
+    overflow = pc.and_(
+        pc.is_inf(pc.cast(text, pa.float64())),
+        pc.invert(pc.match_substring_regex(text, "inf", ignore_case=True)),
+    )
+    return pa.string() if pc.any(overflow).as_py() else None
+
+
+def read_csv_arrow(uploaded_file) -> pd.DataFrame:
+    """
+    Parse a CSV with pyarrow's multi-threaded block parser, keeping pd.read_csv semantics:
+    pandas' NA tokens, mangled duplicate/blank headers, dates and non-decimal numbers left as text,
+    and all-empty columns as float NaN. Types that pyarrow and pandas infer differently are
+    found on the first block, so the file itself is parsed once.
+    Files pyarrow rejects (e.g. rows with missing fields) fall back to pd.read_csv.
+    """
+    dialect = _sniff(uploaded_file.read(SNIFF_BYTES))
+
+    try:
+        schema = _arrow_csv_probe(uploaded_file, dialect).schema
+        names = _dedup_names(schema.names)
+        # pyarrow infers ISO dates/timestamps; pandas keeps them as strings
+        column_types = {name: pa.string() for name, field in zip(names, schema) if pa.types.is_temporal(field.type)}
+        numeric = {
+            name: field.type for name, field in zip(names, schema)
+            if pa.types.is_integer(field.type) or pa.types.is_floating(field.type)
+        }
+        if numeric:
+            probe = _arrow_csv_probe(
+                uploaded_file, dialect, column_names=names, skip_rows=1,
+                include_columns=list(numeric), column_types={name: pa.string() for name in numeric},
+            )
+            try:
+                head = probe.read_next_batch()
+            except StopIteration:
+                head = None
+            for name, inferred in numeric.items():
+                pandas_type = _pandas_number_type(head.column(name), inferred) if head is not None else None
+                if pandas_type is not None:
+                    column_types[name] = pandas_type
+
+        table = _arrow_csv_table(
+            uploaded_file, dialect, column_names=names, skip_rows=1, column_types=column_types
+        )
+    except pa.ArrowInvalid:
+        uploaded_file.seek(0)
+        return pd.read_csv(uploaded_file, sep=dialect["sep"], encoding=dialect["encoding"])
+
+    # All-empty columns: pandas reads them as float NaN (object only when there are no rows at all)
+    for i, field in enumerate(table.schema):
+        if pa.types.is_null(field.type) and table.num_rows:
+            table = table.set_column(i, field.name, table.column(i).cast(pa.float64()))
+    return table.to_pandas(self_destruct=True, types_mapper=_ARROW_TYPES_MAPPER)
+
+
+def to_arrow_strings(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convert all-string object columns to Arrow-backed strings, once, so downstream probes
+    work on contiguous buffers. Mixed-type object columns are left alone for type sniffing.
+    """
+    for col in df.columns:
+        if pd.api.types.is_object_dtype(df[col]) and pd.api.types.infer_dtype(df[col], skipna=True) == "string":
+            df[col] = df[col].astype(ARROW_STRING)
+    return df
+
+
+def as_text(s: pd.Series) -> pd.Series:
+    # Text columns are already Arrow strings after load; only mixed/object columns need a cast
+    if isinstance(s.dtype, pd.StringDtype):
+        return s
+    return s.astype(ARROW_STRING)
 
 
 def load_dataset(uploaded_file) -> pd.DataFrame:
@@ -8,7 +208,123 @@ def load_dataset(uploaded_file) -> pd.DataFrame:
     """
     name = uploaded_file.name.lower().strip()
     if name.endswith(".csv"):
-        return pd.read_csv(uploaded_file)
+        return to_arrow_strings(read_csv_arrow(uploaded_file))
     if name.endswith(".xlsx"):
-        return pd.read_excel(uploaded_file)
-    raise ValueError("Unsupported file type. Please upload a CSV or XLSX.")
\ No newline at end of file
+        return to_arrow_strings(pd.read_excel(uploaded_file, engine="calamine"))
+    raise ValueError("Unsupported file type. Please upload a CSV or XLSX.")
+
+
+def _format_timestamps(arr: pa.ChunkedArray) -> pa.ChunkedArray:
+    # Render like DataFrame.to_csv: date only when every value is midnight, else the coarsest
+    # unit (s/ms/us) that holds every value exactly, since %S prints the unit's fractional digits
+    tz = arr.type.tz
+    for unit in ("s", "ms", "us"):
+        coarse = pc.cast(arr, pa.timestamp(unit, tz), safe=False)
+        if pc.all(pc.equal(pc.cast(coarse, arr.type), arr)).as_py() is not False:
+            arr = coarse
+            break
+    if unit == "s" and tz is None and pc.all(pc.equal(pc.floor_temporal(arr, unit="day"), arr)).as_py() is not False:
+        return pc.strftime(arr, "%Y-%m-%d")
+    return pc.strftime(arr, "%Y-%m-%d %H:%M:%S%Ez" if tz else "%Y-%m-%d %H:%M:%S")
+
+
+def dataframe_to_csv_bytes(df: pd.DataFrame) -> bytes:
+    """
+    Serialize a DataFrame to UTF-8 CSV bytes with pyarrow's multi-threaded writer (no str round-trip).
+    Timestamps are written as in DataFrame.to_csv; unlike it, every string field and header is quoted
+    and floats use Arrow's shortest spelling (1.0 is written as 1, so it reads back as an integer).
+    """
+    buf = io.BytesIO()
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    for i, field in enumerate(table.schema):
+        if pa.types.is_timestamp(field.type):
+            table = table.set_column(i, field.name, _format_timestamps(table.column(i)))
+    pa_csv.write_csv(table, buf, write_options=pa_csv.WriteOptions(include_header=True, quoting_style="needed"))
+    return buf.getvalue()
+
+
+def write_arrow_ipc(df: pd.DataFrame, path: str) -> None:
+    """
+    Persist a DataFrame as an uncompressed Arrow IPC (Feather v2) file, so it can be memory-mapped.
+    Raises pyarrow.ArrowInvalid / ArrowTypeError if a column (e.g. mixed Python types) has no Arrow type.
+    """
+    tmp_path = f"{path}.tmp"
+    try:
+        pa_feather.write_feather(df, tmp_path, compression="uncompressed")
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    os.replace(tmp_path, path)
+
+
+def read_arrow_ipc(path: str) -> pd.DataFrame:
+    """
+    Memory-map an Arrow IPC file written by write_arrow_ipc.
+    String columns stay Arrow-backed and read straight from the mapped pages.
+    """
+    table = pa.ipc.open_file(pa.memory_map(path)).read_all()
+    return table.to_pandas(types_mapper=_ARROW_TYPES_MAPPER)
+
+
+class ArrowSpillStore:
+    """
+    Process-private LRU of DataFrames spilled to Arrow IPC files and memory-mapped back.
+    Files live in a fresh mkdtemp directory (removed at exit); evicted entries delete their file,
+    and only files written by this store are ever read.
+    """
+
+    def __init__(self, max_entries: int = 4):
+        self.max_entries = max_entries
+        self.directory = tempfile.mkdtemp(prefix="data_drop_")
+        self._entries: OrderedDict = OrderedDict()
+        self._counter = 0
+        self._lock = threading.Lock()
+        atexit.register(shutil.rmtree, self.directory, ignore_errors=True)
+
+    def put(self, key: str, df: pd.DataFrame) -> bool:
+        """
+        Spill `df` under `key`. Returns False (nothing stored) if it has no Arrow representation,
+        e.g. object columns holding mixed Python types.
+        """
+        # Positional names on disk; the original labels (non-string, duplicates) are restored on read
+        on_disk = df.copy(deep=False)
+        on_disk.columns = [str(i) for i in range(df.shape[1])]
+        with self._lock:
+            self._counter += 1
+            path = os.path.join(self.directory, f"{self._counter}.arrow")
+        try:
+            write_arrow_ipc(on_disk, path)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            return False
+
+        with self._lock:
+            self._drop(key)
+            self._entries[key] = {"path": path, "columns": df.columns, "df": None}
+            while len(self._entries) > self.max_entries:
+                self._drop(next(iter(self._entries)))
+        return True
+
+    def get(self, key: str) -> Optional[pd.DataFrame]:
+        """
+        Memory-mapped frame for `key`, or None if it was never stored or has been evicted.
+        The frame is shared between sessions: treat it as read-only.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            if entry["df"] is None:
+                df = read_arrow_ipc(entry["path"])
+                df.columns = entry["columns"]
+                entry["df"] = df
+            return entry["df"]
+
+    def _drop(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            try:
+                os.remove(entry["path"])  # live memory maps stay valid after unlink
+            except OSError:
+                pass
@@ -1,43 +1,99 @@
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+
+HLL_PRECISION = 12  # 4096 registers, ~1.6% relative error
+APPROX_DISTINCT_MIN_ROWS = 1 << 16  # below this, exact nunique is cheap enough
+
+
+def approx_distinct(values: np.ndarray) -> int:
+    """
+    HyperLogLog estimate of the number of distinct non-null values, vectorized in NumPy.
+    Avoids building a hash table of every distinct value (O(distinct) memory).
+    """
+    values = values[~pd.isna(values)]
+    if not len(values):
+        return 0
+    m = 1 << HLL_PRECISION
+    hashes = pd.util.hash_array(values)
+    buckets = (hashes >> np.uint64(64 - HLL_PRECISION)).astype(np.intp)
+    # Leading zeros of the remaining bits + 1; the sentinel bit caps the rank
+    rest = (hashes << np.uint64(HLL_PRECISION)) | np.uint64(1 << (HLL_PRECISION - 1))
+    ranks = (64 - np.floor(np.log2(rest.astype(np.float64)))).astype(np.uint8)
+    registers = np.zeros(m, dtype=np.uint8)
+    np.maximum.at(registers, buckets, ranks)
+
+    alpha = 0.7213 / (1 + 1.079 / m)
+    estimate = alpha * m * m / np.exp2(-registers.astype(np.float64)).sum()
+    empty = int(np.count_nonzero(registers == 0))
+    if estimate <= 2.5 * m and empty:
+        estimate = m * np.log(m / empty)  # small-range (linear counting) correction
+    return int(round(min(estimate, len(values))))
 
 
 def build_column_profile(df: pd.DataFrame) -> pd.DataFrame:
     """
     Create a column-level profiling table.
+    Stats are computed frame-wide (one vectorized call per stat) rather than per column.
+    `unique_values` is a HyperLogLog estimate for float columns on large frames, exact otherwise.
+    """
+    n_rows = len(df)
+    null_rates = df.isna().mean()
+
+    approx_cols = df.select_dtypes(include="floating").columns if n_rows >= APPROX_DISTINCT_MIN_ROWS else []
+    uniques = df.drop(columns=approx_cols).nunique(dropna=True).reindex(df.columns)
+    for col in approx_cols:
+        uniques[col] = approx_distinct(df[col].to_numpy())
+    cardinality = uniques / n_rows if n_rows else uniques * 0.0
+
+    # min/max only apply to numeric and datetime columns; everything else stays blank
+    min_vals = pd.Series("", index=df.columns, dtype=object)
+    max_vals = pd.Series("", index=df.columns, dtype=object)
+    for include in ([np.number, "bool"], ["datetime", "datetimetz"]):
+        typed = df.select_dtypes(include=include)
+        if typed.shape[1]:
+            min_vals.loc[typed.columns] = typed.min(skipna=True).astype(object)
+            max_vals.loc[typed.columns] = typed.max(skipna=True).astype(object)
+
+    return pd.DataFrame(
+        {
+            "column": [str(c) for c in df.columns],
+            "dtype": df.dtypes.astype(str).values,
+            "null_%": (null_rates * 100).round(2).astype(float).values,
+            "unique_values": uniques.astype(int).values,
+            "cardinality": cardinality.round(3).astype(float).values,
+            "min": min_vals.values,
+            "max": max_vals.values,
+        }
+    )
+
+
+def count_duplicate_rows(df: pd.DataFrame) -> int:
+    """
+    Count exact duplicate rows. One row-hash pass picks the candidate rows (cheaper than row
+    comparison on wide frames); only those are compared by value, since hashes of mixed object
+    columns can collide (1 vs "1", None vs "None").
+    """
+    if df.empty:
+        return 0
+    candidates = pd.util.hash_pandas_object(df, index=False).duplicated(keep=False).to_numpy()
+    if not candidates.any():
+        return 0
+    return int(df[candidates].duplicated().sum())
+
+
+def _is_arrow_backed(dtype) -> bool:
+    if isinstance(dtype, pd.ArrowDtype):
+        return True
+    return isinstance(dtype, pd.StringDtype) and dtype.storage.startswith("pyarrow")
+
+
+def count_missing_cells(df: pd.DataFrame) -> int:
+    """
+    Count missing cells. Arrow-backed columns read their precomputed null counts (no data scan);
+    the remaining columns are summed as one contiguous boolean block.
     """
-    rows = []
-
-    for col in df.columns:
-        s = df[col]
-        null_rate = float(s.isna().mean())
-        unique_count = int(s.nunique(dropna=True))
-        cardinality = float(unique_count / len(df)) if len(df) else 0.0
-
-        min_val = ""
-        max_val = ""
-        if pd.api.types.is_numeric_dtype(s):
-            try:
-                min_val = s.min(skipna=True)
-                max_val = s.max(skipna=True)
-            except Exception:
-                pass
-        elif pd.api.types.is_datetime64_any_dtype(s):
-            try:
-                min_val = s.min(skipna=True)
-                max_val = s.max(skipna=True)
-            except Exception:
-                pass
-
-        rows.append(
-            {
-                "column": str(col),
-                "dtype": str(s.dtype),
-                "null_%": round(null_rate * 100, 2),
-                "unique_values": unique_count,
-                "cardinality": round(cardinality, 3),
-                "min": min_val,
-                "max": max_val,
-            }
-        )
-
-    return pd.DataFrame(rows)
\ No newline at end of file
+    arrow_mask = np.array([_is_arrow_backed(dtype) for dtype in df.dtypes], dtype=bool)
+    total = sum(pa.array(s.array).null_count for _, s in df.iloc[:, arrow_mask].items())
+    total += df.iloc[:, ~arrow_mask].isna().to_numpy().sum()
+    return int(total)
@@ -1,38 +1,108 @@
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+
+from inspector.io import as_text
+from inspector.profiling import count_duplicate_rows
+
+try:
+    import polars as pl  # optional: Rust regex over the Arrow buffer in one call
+except ImportError:
+    pl = None
+
+try:
+    import re2  # optional: google-re2 matches in linear time without backtracking
+except ImportError:
+    re2 = None
+
+EMAIL_PATTERN = r"^[A-Za-z0-9._%+\-]+@[A-Za-z0-9.\-]+\.[A-Za-z]{2,}$"
+EMAIL_REGEX = re.compile(EMAIL_PATTERN)
+_EMAIL_MATCHER = re2.compile(EMAIL_PATTERN) if re2 is not None else EMAIL_REGEX
+_match_email = np.frompyfunc(lambda v: _EMAIL_MATCHER.match(v) is not None, 1, 1)
+
+# "ISO8601" is pandas' fast path for any ISO 8601 variant (fractional seconds, offsets, "Z")
+DATE_FORMATS = ["%Y-%m-%d", "%d/%m/%Y", "%m/%d/%Y", "%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S", "ISO8601"]
+DATE_FAIL_THRESHOLD = 0.2
+DATE_FORMAT_MIN_MATCH = 0.5  # below this, the column is not written in any of DATE_FORMATS
+
+CURRENCY_GROUPS = {"eur": "€", "usd": "$", "gbp": "£"}
+_NUMERIC_HINTS = {
+    **{group: re.escape(sym) for group, sym in CURRENCY_GROUPS.items()},
+    "percent": "%",
+    "eu_thousands": r"\d{1,3}(?:\.\d{3})+(?:,\d{1,2})?$",
+    "eu_decimal": r"\d+,\d{1,2}$",
+}
+NUMERIC_HINTS_REGEX = re.compile(
+    "".join(f"(?=(?:.*?(?P<{group}>{pattern}))?)" for group, pattern in _NUMERIC_HINTS.items()),
+    re.DOTALL,
+)
+
+
+def email_valid_rate(sample: pd.Series) -> float:
+    """
+    Share of (non-null, stripped) text values that match EMAIL_PATTERN.
+    Uses polars if installed, else google-re2, else the stdlib regex.
+    """
+    if pl is not None:
+        return float(pl.from_arrow(pa.array(as_text(sample))).str.contains(EMAIL_PATTERN).mean())
+    return float(_match_email(sample.to_numpy(dtype=object)).astype(bool).mean())
+
 
-EMAIL_REGEX = re.compile(r"^[A-Za-z0-9._%+\-]+@[A-Za-z0-9.\-]+\.[A-Za-z]{2,}$")
+# Column-name heuristics, one case-insensitive pattern per check
+EMAIL_NAME_REGEX = re.compile(r"email|mail\s*$", re.IGNORECASE)
+DATE_NAME_REGEX = re.compile(r"date|fecha|datetime|timestamp|created|updated", re.IGNORECASE)
+NUMERIC_NAME_REGEX = re.compile(
+    r"price|amount|importe|total|qty|quantity|units|discount|pct|percent|%", re.IGNORECASE
+)
 
 
 def looks_like_email_column(col_name: str) -> bool:
-    name = col_name.strip().lower()
-    return ("email" in name) or (name.endswith("_mail")) or (name.endswith("mail"))
+    return EMAIL_NAME_REGEX.search(col_name) is not None
 
 
 def looks_like_date_column(col_name: str) -> bool:
-    name = col_name.strip().lower()
-    keywords = ["date", "fecha", "datetime", "timestamp", "created", "updated"]
-    return any(k in name for k in keywords)
+    return DATE_NAME_REGEX.search(col_name) is not None
 
 
 def looks_like_numeric_column(col_name: str) -> bool:
-    name = col_name.strip().lower()
-    keywords = ["price", "amount", "importe", "total", "qty", "quantity", "units", "discount", "pct", "percent", "%"]
-    return any(k in name for k in keywords)
+    return NUMERIC_NAME_REGEX.search(col_name) is not None
+
+
+def matching_columns(columns: pd.Index, name_regex: re.Pattern) -> pd.Index:
+    # One vectorized scan over all column names instead of a Python test per column
+    mask = pd.Index(columns).astype(str).str.contains(name_regex)
+    return columns[np.asarray(mask, dtype=bool)]
+
+
+def _sample_head(s: pd.Series, k: int = 2000) -> pd.Series:
+    # Systematic (strided) sample: O(k), sequential access, deterministic without an RNG.
+    # Ceiling division so the stride spans the whole series instead of stopping at the first k*step rows.
+    step = max(1, -(-len(s) // k))
+    return s.iloc[::step].head(k)
 
 
 def infer_mixed_types(series: pd.Series, sample_size: int = 200) -> bool:
     s = series.dropna()
     if s.empty:
         return False
-    sample = s.sample(min(sample_size, len(s)), random_state=42)
-    types = {type(x).__name__ for x in sample.tolist()}
-    return len(types) > 1
+    sample = _sample_head(s, sample_size)
+    values = sample.to_numpy(dtype=object, copy=False)
+    first = type(values[0])
+    for x in values:
+        if type(x) is not first:
+            return True
+    return False
 
 
-def detect_issues(df: pd.DataFrame, profile_rows: list[dict]) -> list[dict]:
+def detect_issues(df: pd.DataFrame, profile_rows: list[dict], dup_count: Optional[int] = None) -> list[dict]:
     """
     Return a list of issues with severity/title/details/suggestion.
+    Pass `dup_count` if the duplicate-row count is already known to skip recomputing it.
     """
     issues = []
 
@@ -50,7 +120,8 @@ def detect_issues(df: pd.DataFrame, profile_rows: list[dict]) -> list[dict]:
         })
 
     # Duplicate rows
-    dup_count = int(df.duplicated().sum())
+    if dup_count is None:
+        dup_count = count_duplicate_rows(df)
     if dup_count > 0:
         issues.append({
             "severity": "warning",
@@ -70,14 +141,16 @@ def detect_issues(df: pd.DataFrame, profile_rows: list[dict]) -> list[dict]:
             "suggestion": "Decide whether to impute, drop, or treat as optional. Validate upstream source if unexpected.",
         })
 
+    # Per-column probes (mixed types, emails, dates, numeric-as-text) are independent,
+    # so they run on a thread pool; pandas releases the GIL in most of their C paths.
+    work = [(_mixed_types_probe, col) for col in df.columns]
+    for check, name_regex in COLUMN_CHECKS:
+        work.extend((check, col) for col in matching_columns(df.columns, name_regex))
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+        results = list(pool.map(lambda item: item[0](df[item[1]]), work))
+
     # Mixed types
-    mixed_cols = []
-    for col in df.columns:
-        try:
-            if infer_mixed_types(df[col]):
-                mixed_cols.append(str(col))
-        except Exception:
-            pass
+    mixed_cols = [str(col) for (fn, col), hit in zip(work, results) if fn is _mixed_types_probe and hit]
     if mixed_cols:
         issues.append({
             "severity": "critical",
@@ -86,121 +159,172 @@ def detect_issues(df: pd.DataFrame, profile_rows: list[dict]) -> list[dict]:
             "suggestion": "Standardize formats and cast types. Mixed-type columns frequently break pipelines.",
         })
 
-    # Email checks
-    issues.extend(detect_email_issues(df))
+    # Email, date parsing and numeric-as-text checks (worklist order: check, then column)
+    issues.extend(r for (fn, _), r in zip(work, results) if fn is not _mixed_types_probe and r)
 
-    # Date parsing checks
-    issues.extend(detect_date_parse_issues(df))
+    return issues
 
-    # Numeric-as-text checks
-    issues.extend(detect_numeric_as_text_issues(df))
 
-    return issues
+def _mixed_types_probe(series: pd.Series) -> bool:
+    try:
+        return infer_mixed_types(series)
+    except Exception:
+        return False
 
 
-def detect_email_issues(df: pd.DataFrame) -> list[dict]:
-    issues = []
-    for col in df.columns:
-        if not looks_like_email_column(str(col)):
-            continue
-        s = df[col].dropna()
-        if s.empty:
-            continue
-
-        s_str = s.astype("string").str.strip()
-        sample = s_str.sample(min(2000, len(s_str)), random_state=42)
-        invalid_mask = ~sample.fillna("").str.match(EMAIL_REGEX)
-        invalid_rate = float(invalid_mask.mean())
-
-        if invalid_rate >= 0.05:
-            issues.append({
-                "severity": "warning",
-                "title": f"Invalid emails in `{col}`",
-                "details": f"~{round(invalid_rate * 100, 2)}% of sampled values look invalid.",
-                "suggestion": "Trim whitespace and validate formatting upstream. Consider rejecting invalid addresses at ingestion.",
-            })
-    return issues
+def check_email_column(series: pd.Series) -> Optional[dict]:
+    col = series.name
+    s = series.dropna()
+    if s.empty:
+        return None
 
+    s_str = as_text(s).str.strip()
+    sample = _sample_head(s_str)
+    invalid_rate = 1.0 - email_valid_rate(sample)
 
-def detect_date_parse_issues(df: pd.DataFrame) -> list[dict]:
-    issues = []
-    for col in df.columns:
-        if not looks_like_date_column(str(col)):
-            continue
-
-        s = df[col].dropna()
-        if s.empty:
-            continue
-
-        if pd.api.types.is_datetime64_any_dtype(df[col]):
-            continue
-
-        s_str = s.astype("string").str.strip()
-        sample = s_str.sample(min(2000, len(s_str)), random_state=42)
-
-        parsed = pd.to_datetime(sample, errors="coerce", infer_datetime_format=True, dayfirst=True)
-        fail_rate = float(parsed.isna().mean())
-
-        date_like = sample.str.contains(r"[-/:\.]", regex=True).mean()
-        if date_like >= 0.4 and fail_rate >= 0.2:
-            issues.append({
-                "severity": "warning",
-                "title": f"Date parsing issues in `{col}`",
-                "details": f"~{round(fail_rate * 100, 2)}% of sampled values failed parsing.",
-                "suggestion": "Standardize dates (ISO 8601). Avoid mixing formats and ensure consistent timezone handling.",
-            })
-    return issues
+    if invalid_rate < 0.05:
+        return None
+    return {
+        "severity": "warning",
+        "title": f"Invalid emails in `{col}`",
+        "details": f"~{round(invalid_rate * 100, 2)}% of sampled values look invalid.",
+        "suggestion": "Trim whitespace and validate formatting upstream. Consider rejecting invalid addresses at ingestion.",
+    }
 
 
-def detect_numeric_as_text_issues(df: pd.DataFrame) -> list[dict]:
-    issues = []
-    currency_symbols = ["€", "$", "£"]
+def _date_fail_rate(sample: pd.Series, **kwargs) -> float:
+    # utc=True: values with and without offsets in one column would otherwise raise
+    return float(pd.to_datetime(sample, errors="coerce", utc=True, **kwargs).isna().mean())
+
+
+def date_parse_fail_rate(sample: pd.Series) -> tuple[float, bool]:
+    """
+    Share of values that fail to parse, and whether it was measured against a single format.
+    If some format in DATE_FORMATS matches at least DATE_FORMAT_MIN_MATCH of the values, its fail
+    rate is used, so mixed formats count as failures. Otherwise, if most values share one layout
+    (digit and letter runs collapsed), the column is in one format outside the list and the
+    per-element mixed parse decides.
+    """
+    best_fail = 1.0
+    for fmt in DATE_FORMATS:
+        best_fail = min(best_fail, _date_fail_rate(sample, format=fmt))
+        if best_fail < DATE_FAIL_THRESHOLD:
+            break
+    if 1.0 - best_fail >= DATE_FORMAT_MIN_MATCH:
+        return best_fail, True
+    layouts = sample.str.replace(r"\d+", "9", regex=True).str.replace(r"[^\W\d_]+", "a", regex=True)
+    if layouts.value_counts(normalize=True).iloc[0] < DATE_FORMAT_MIN_MATCH:
+        return best_fail, True
+    return _date_fail_rate(sample, format="mixed", dayfirst=True), False
+
+
+def check_date_column(series: pd.Series) -> Optional[dict]:
+    col = series.name
+    s = series.dropna()
+    if s.empty:
+        return None
 
-    for col in df.columns:
-        if not looks_like_numeric_column(str(col)):
-            continue
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return None
 
-        s = df[col].dropna()
-        if s.empty:
-            continue
+    s_str = as_text(s).str.strip()
+    sample = _sample_head(s_str)
 
-        if pd.api.types.is_numeric_dtype(df[col]):
-            continue
+    date_like = sample.str.contains(r"[-/:\.]", regex=True).mean()
+    if date_like < 0.4:
+        return None
 
-        s_str = s.astype("string").str.strip()
-        sample = s_str.sample(min(2000, len(s_str)), random_state=42)
+    fail_rate, single_format = date_parse_fail_rate(sample)
+    if fail_rate < DATE_FAIL_THRESHOLD:
+        return None
 
-        has_currency = any(sample.str.contains(re.escape(sym), regex=True).mean() > 0.05 for sym in currency_symbols)
-        has_percent = sample.str.contains("%", regex=False).mean() > 0.05
-        has_eu_number = (
-            sample.str.contains(r"\d{1,3}(\.\d{3})+(,\d{1,2})?$", regex=True).mean() > 0.10
-            or sample.str.contains(r"\d+,\d{1,2}$", regex=True).mean() > 0.10
+    if not single_format:
+        details = (
+            f"~{round(fail_rate * 100, 2)}% of sampled values are not parseable as dates "
+            "(the rest share one format outside the common ones)."
         )
+    else:
+        # The slow per-element parse only splits "not a date at all" from "inconsistent format"
+        unparseable = _date_fail_rate(sample, format="mixed", dayfirst=True)
+        details = f"~{round(fail_rate * 100, 2)}% of sampled values failed parsing with a single date format"
+        if unparseable < fail_rate:
+            details += f" (mixed formats; ~{round(unparseable * 100, 2)}% are not parseable as dates at all)."
+        else:
+            details += "."
+    return {
+        "severity": "warning",
+        "title": f"Date parsing issues in `{col}`",
+        "details": details,
+        "suggestion": "Standardize dates (ISO 8601). Avoid mixing formats and ensure consistent timezone handling.",
+    }
+
+
+def check_numeric_as_text_column(series: pd.Series) -> Optional[dict]:
+    col = series.name
+    s = series.dropna()
+    if s.empty:
+        return None
+
+    if pd.api.types.is_numeric_dtype(series):
+        return None
+
+    s_str = as_text(s).str.strip()
+    sample = _sample_head(s_str)
+
+    # One regex pass over the sample; each always-succeeding lookahead captures one hint
+    hits = sample.str.extract(NUMERIC_HINTS_REGEX).notna().mean(axis=0)
+    has_currency = bool((hits[list(CURRENCY_GROUPS)] > 0.05).any())
+    has_percent = bool(hits["percent"] > 0.05)
+    has_eu_number = bool(hits["eu_thousands"] > 0.10 or hits["eu_decimal"] > 0.10)
+
+    cleaned = sample.str.replace(r"[€$£% .]", "", regex=True).str.replace(",", ".", regex=False)
+
+    coerced = pd.to_numeric(cleaned, errors="coerce")
+    success = float(coerced.notna().mean())
+
+    if success < 0.6 or not (has_currency or has_percent or has_eu_number):
+        return None
+
+    hints = []
+    if has_currency:
+        hints.append("currency symbols")
+    if has_percent:
+        hints.append("percent signs")
+    if has_eu_number:
+        hints.append("EU number formatting")
+
+    return {
+        "severity": "warning",
+        "title": f"Numeric-as-text in `{col}`",
+        "details": f"Detected {', '.join(hints)}. ~{round(success * 100, 2)}% could be parsed after cleaning.",
+        "suggestion": "Normalize symbols/separators and cast to numeric types to avoid downstream bugs.",
+    }
+
 
-        cleaned = sample
-        for sym in currency_symbols:
-            cleaned = cleaned.str.replace(sym, "", regex=False)
-        cleaned = cleaned.str.replace("%", "", regex=False)
-        cleaned = cleaned.str.replace(" ", "", regex=False)
-        cleaned = cleaned.str.replace(".", "", regex=False).str.replace(",", ".", regex=False)
-
-        coerced = pd.to_numeric(cleaned, errors="coerce")
-        success = float(coerced.notna().mean())
-
-        if success >= 0.6 and (has_currency or has_percent or has_eu_number):
-            hints = []
-            if has_currency:
-                hints.append("currency symbols")
-            if has_percent:
-                hints.append("percent signs")
-            if has_eu_number:
-                hints.append("EU number formatting")
-
-            issues.append({
-                "severity": "warning",
-                "title": f"Numeric-as-text in `{col}`",
-                "details": f"Detected {', '.join(hints)}. ~{round(success * 100, 2)}% could be parsed after cleaning.",
-                "suggestion": "Normalize symbols/separators and cast to numeric types to avoid downstream bugs.",
-            })
-
-    return issues
\ No newline at end of file
+# (check, column-name pattern) pairs, in the order their issues are reported
+COLUMN_CHECKS = [
+    (check_email_column, EMAIL_NAME_REGEX),
+    (check_date_column, DATE_NAME_REGEX),
+    (check_numeric_as_text_column, NUMERIC_NAME_REGEX),
+]
+
+
+def _run_check(df: pd.DataFrame, check, name_regex: re.Pattern) -> list[dict]:
+    issues = []
+    for col in matching_columns(df.columns, name_regex):
+        issue = check(df[col])
+        if issue:
+            issues.append(issue)
+    return issues
+
+
+def detect_email_issues(df: pd.DataFrame) -> list[dict]:
+    return _run_check(df, check_email_column, EMAIL_NAME_REGEX)
+
+
+def detect_date_parse_issues(df: pd.DataFrame) -> list[dict]:
+    return _run_check(df, check_date_column, DATE_NAME_REGEX)
+
+
+def detect_numeric_as_text_issues(df: pd.DataFrame) -> list[dict]:
+    return _run_check(df, check_numeric_as_text_column, NUMERIC_NAME_REGEX)